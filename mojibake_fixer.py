@@ -18,8 +18,45 @@ Usage:
 """
 
 import os
+import re
 import sys
+import codecs
+import shutil
+import struct
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional acceleration: NumPy vectorizes the CJK classifier, and Numba
+# (which requires NumPy) JIT-compiles its counting loop. The pure Python
+# fallback below keeps text mode dependency-free.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if np is not None and numba is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def _cjk_counts(cps):
+        """Count CJK and garbage codepoints in a uint32 array."""
+        cjk = 0
+        garbage = 0
+        for cp in cps:
+            if ((0x4E00 <= cp <= 0x9FFF)      # CJK Unified Ideographs
+                    or (0x3400 <= cp <= 0x4DBF)   # CJK Extension A
+                    or (0x3000 <= cp <= 0x303F)   # CJK Symbols and Punctuation
+                    or (0xFF00 <= cp <= 0xFFEF)):  # Halfwidth and Fullwidth Forms
+                cjk += 1
+            elif cp == 0xFFFD or (0x80 <= cp < 0x100):
+                garbage += 1
+        return cjk, garbage
+else:
+    _cjk_counts = None
 
 # --- CONFIGURATION ---
 # DICOM tags commonly affected by Big5 mojibake
@@ -39,9 +76,42 @@ TARGET_TAGS = [
 # CORE TEXT FIXING FUNCTIONS (No dependencies)
 # =============================================================================
 
+# Codec callables resolved once, bypassing the registry lookup that
+# str.encode / bytes.decode repeat on every call
+_latin1_encode = codecs.getencoder('latin-1')
+_cp1252_encode = codecs.getencoder('cp1252')
+_big5_decode = codecs.getdecoder('big5')
+
+# Big5 double-byte sequences as seen through Latin-1: lead 0x81-0xFE,
+# trail 0x40-0x7E or 0xA1-0xFE. Chars in 0x80-0xFF that the pattern does
+# not consume correspond to bytes a strict Big5 decode would reject.
+_BIG5_PAIR_RE = re.compile('[\x81-\xfe][\x40-\x7e\xa1-\xfe]')
+_HIGH_RE = re.compile('[\x80-\xff]')
+
+# Runs of high-byte chars (plus replacement chars) -- the segments that
+# may decode as Big5 while the surrounding ASCII is left alone.
+_HIGH_RUN_RE = re.compile('[\x80-\xff�]+')
+
+
+def _build_big5_pairs():
+    """Map each valid Big5 byte pair (as a Latin-1 char pair) to its CJK char."""
+    pairs = {}
+    for lead in range(0x81, 0xFF):
+        for trail in list(range(0x40, 0x7F)) + list(range(0xA1, 0xFF)):
+            try:
+                decoded = _big5_decode(bytes((lead, trail)))[0]
+            except UnicodeDecodeError:
+                continue
+            pairs[chr(lead) + chr(trail)] = decoded
+    return pairs
+
+
+_BIG5_PAIRS = _build_big5_pairs()
+
+@functools.lru_cache(maxsize=4096)
 def fix_text_encoding(text):
     """
-    Attempts to fix Mojibake: 
+    Attempts to fix Mojibake:
     Reverses Latin-1 interpretation to bytes, then decodes as Big5.
     
     Enhanced to handle:
@@ -62,34 +132,61 @@ def fix_text_encoding(text):
         >>> fix_text_encoding("Rt ANKLE CT (µL³y¼v¾¯)")
         'Rt ANKLE CT (無造影劑)'
     """
-    if not text:
+    # Fast path: empty or pure ASCII needs no fixing (one C-level scan)
+    if not text or text.isascii():
         return None
-    
-    # Optimization: Skip pure ASCII
-    if all(ord(c) < 128 for c in text):
-        return None
-    
-    # Check if text has high bytes that look like mojibake
-    has_high_bytes = any(128 <= ord(c) < 256 for c in text)
+
+    # Classify the input from its highest codepoint -- one more C-level
+    # pass instead of separate Python loops per condition.
+    max_cp = ord(max(text))
+
+    if max_cp < 0x100:
+        # Everything fits Latin-1: the classic mojibake candidate. Not
+        # ASCII, so there is at least one char in the 0x80-0xFF range.
+        latin1_clean = True
+        has_high_bytes = True
+    else:
+        # Mixed content: look for suspect 0x80-0xFF chars directly with
+        # the compiled regex -- no intermediate encode allocation.
+        latin1_clean = False
+        has_high_bytes = _HIGH_RE.search(text) is not None
+
     has_replacement = '\ufffd' in text
-    
+
     if not has_high_bytes and not has_replacement:
         return None
-    
-    # Strategy 1: Try simple Latin-1 -> Big5 decode
-    try:
-        raw_bytes = text.encode('latin-1')
-        fixed = raw_bytes.decode('big5')
-        if fixed != text and _looks_like_valid_cjk(fixed):
+
+    # Strategy 1: Simple Latin-1 -> Big5 via the precompiled pair table.
+    # One C-level regex pass replaces the encode/decode codec round-trip.
+    if latin1_clean:
+        invalid = False
+
+        def _pair_sub(m):
+            nonlocal invalid
+            decoded = _BIG5_PAIRS.get(m.group())
+            if decoded is None:
+                # Lead/trail bytes in range but the pair is unassigned:
+                # a strict Big5 decode would fail here
+                invalid = True
+                return m.group()
+            return decoded
+
+        fixed = _BIG5_PAIR_RE.sub(_pair_sub, text)
+        # Judge validity from the *input*, not the output: some valid
+        # Big5 pairs decode to Latin-1 symbols (e.g. A1D3 -> '±',
+        # A258 -> '°'), so high chars in `fixed` are fine. What is not
+        # fine is a high char the pair pattern never consumed -- the
+        # same condition as a strict decode failure.
+        if (not invalid and fixed != text
+                and not _HIGH_RE.search(_BIG5_PAIR_RE.sub('', text))
+                and _looks_like_valid_cjk(fixed)):
             return fixed
-    except (UnicodeEncodeError, UnicodeDecodeError):
-        pass
     
     # Strategy 2: Try CP1252 (Windows) -> Big5 decode
     # CP1252 is a superset of Latin-1 with extra chars in 0x80-0x9F range
     try:
-        raw_bytes = text.encode('cp1252', errors='replace')
-        fixed = raw_bytes.decode('big5', errors='replace')
+        raw_bytes = _cp1252_encode(text, 'replace')[0]
+        fixed = _big5_decode(raw_bytes, 'replace')[0]
         if fixed != text and _looks_like_valid_cjk(fixed) and fixed.count('\ufffd') < text.count('\ufffd'):
             return fixed
     except (UnicodeEncodeError, UnicodeDecodeError):
@@ -104,30 +201,81 @@ def fix_text_encoding(text):
     return None
 
 
+# Expose cache_clear for tests / long-running callers
+_fix_cache_clear = fix_text_encoding.cache_clear
+
+
+# Class codes for the packed codepoint table below
+_CLS_CJK = 1
+_CLS_GARBAGE = 2
+
+# Codepoint -> class translate table, built on first use so importing
+# the module (e.g. for --help or pure-DICOM runs on clean data) does
+# not pay for the ~25k-entry build.
+_CLASS_TRANS = None
+
+
+def _class_trans():
+    """Return the codepoint -> class-tag table for str.translate.
+
+    The classes are first packed into a frozen bytes table (one byte per
+    BMP codepoint, filled by range slicing), then expanded into the
+    translate dict: 'C' for CJK, 'G' for garbage (replacement char or
+    unfixed Latin-1 high bytes). Neutral codepoints are absent and pass
+    through untranslated.
+    """
+    global _CLASS_TRANS
+    if _CLASS_TRANS is None:
+        cls = bytearray(0x10000)
+        cls[0x4E00:0xA000] = b'\x01' * (0xA000 - 0x4E00)  # CJK Unified Ideographs
+        cls[0x3400:0x4DC0] = b'\x01' * (0x4DC0 - 0x3400)  # CJK Extension A
+        cls[0x3000:0x3040] = b'\x01' * 0x40               # CJK Symbols and Punctuation
+        cls[0xFF00:0xFFF0] = b'\x01' * 0xF0               # Halfwidth and Fullwidth Forms
+        cls[0x80:0x100] = b'\x02' * 0x80                  # Unfixed Latin-1 high bytes
+        cls[0xFFFD] = _CLS_GARBAGE                        # Replacement character
+        table = bytes(cls)
+
+        trans = {cp: 'C' if v == _CLS_CJK else 'G'
+                 for cp, v in enumerate(table) if v}
+        # Neutralize literal 'C'/'G' in the input so they cannot be
+        # counted as class tags.
+        trans[ord('C')] = 'N'
+        trans[ord('G')] = 'N'
+        _CLASS_TRANS = trans
+    return _CLASS_TRANS
+
+
+@functools.lru_cache(maxsize=8192)
 def _looks_like_valid_cjk(text):
     """Check if text contains likely valid CJK characters (not just garbage)."""
     if not text:
         return False
-    
-    cjk_count = 0
-    garbage_count = 0
-    
-    for c in text:
-        cp = ord(c)
-        # CJK Unified Ideographs and common ranges
-        if 0x4E00 <= cp <= 0x9FFF:  # CJK Unified Ideographs
-            cjk_count += 1
-        elif 0x3400 <= cp <= 0x4DBF:  # CJK Extension A
-            cjk_count += 1
-        elif 0x3000 <= cp <= 0x303F:  # CJK Symbols and Punctuation
-            cjk_count += 1
-        elif 0xFF00 <= cp <= 0xFFEF:  # Halfwidth and Fullwidth Forms
-            cjk_count += 1
-        elif cp == 0xFFFD:  # Replacement character
-            garbage_count += 1
-        elif 128 <= cp < 256:  # Still has Latin-1 high bytes (unfixed)
-            garbage_count += 1
-    
+
+    if np is not None:
+        cps = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+        # JIT path: one fused loop over the codepoints, no mask temporaries
+        if _cjk_counts is not None:
+            cjk_count, garbage_count = _cjk_counts(cps)
+            return cjk_count > 0 and garbage_count <= len(cps) * 0.3
+
+        # Vectorized path: apply range masks in one pass instead of
+        # branching per char.
+        cjk = (((cps >= 0x4E00) & (cps <= 0x9FFF))     # CJK Unified Ideographs
+               | ((cps >= 0x3400) & (cps <= 0x4DBF))   # CJK Extension A
+               | ((cps >= 0x3000) & (cps <= 0x303F))   # CJK Symbols and Punctuation
+               | ((cps >= 0xFF00) & (cps <= 0xFFEF)))  # Halfwidth and Fullwidth Forms
+        if not cjk.any():
+            return False
+        garbage = (cps == 0xFFFD) | ((cps >= 0x80) & (cps < 0x100))
+        return np.count_nonzero(garbage) <= len(cps) * 0.3
+
+    # Table lookup: translate each char to its class tag in one C-level
+    # pass, then count tags -- no per-character Python branching.
+    classes = text.translate(_class_trans())
+    cjk_count = classes.count('C')
+    garbage_count = classes.count('G')
+
     # Consider valid if we have CJK chars and not too much garbage
     return cjk_count > 0 and garbage_count <= len(text) * 0.3
 
@@ -135,44 +283,16 @@ def _looks_like_valid_cjk(text):
 def _fix_text_segmented(text):
     """
     Fix text by processing segments separately.
-    
-    Splits text at ASCII/high-byte boundaries and tries to decode
-    high-byte segments as Big5 while preserving ASCII.
+
+    Locates runs of high-byte (and replacement) characters in one
+    C-level regex pass and tries to decode each run as Big5 while
+    preserving the surrounding ASCII.
     """
     if not text:
         return None
-    
-    result = []
-    segment = []
-    is_high_byte_segment = False
-    
-    for i, c in enumerate(text):
-        char_is_high = ord(c) >= 128
-        
-        # Detect segment boundary
-        if segment and char_is_high != is_high_byte_segment:
-            # Process completed segment
-            seg_text = ''.join(segment)
-            if is_high_byte_segment:
-                decoded = _try_decode_segment(seg_text)
-                result.append(decoded if decoded else seg_text)
-            else:
-                result.append(seg_text)
-            segment = []
-        
-        segment.append(c)
-        is_high_byte_segment = char_is_high
-    
-    # Process final segment
-    if segment:
-        seg_text = ''.join(segment)
-        if is_high_byte_segment:
-            decoded = _try_decode_segment(seg_text)
-            result.append(decoded if decoded else seg_text)
-        else:
-            result.append(seg_text)
-    
-    return ''.join(result)
+
+    return _HIGH_RUN_RE.sub(
+        lambda m: _try_decode_segment(m.group()) or m.group(), text)
 
 
 def _try_decode_segment(segment):
@@ -187,18 +307,18 @@ def _try_decode_segment(segment):
     
     # Try Latin-1 -> Big5
     try:
-        raw_bytes = clean_segment.encode('latin-1')
-        decoded = raw_bytes.decode('big5', errors='replace')
+        raw_bytes = _latin1_encode(clean_segment)[0]
+        decoded = _big5_decode(raw_bytes, 'replace')[0]
         # Check if we got valid CJK
         if _looks_like_valid_cjk(decoded):
             return decoded
     except (UnicodeEncodeError, UnicodeDecodeError):
         pass
-    
+
     # Try CP1252 -> Big5
     try:
-        raw_bytes = clean_segment.encode('cp1252', errors='replace')
-        decoded = raw_bytes.decode('big5', errors='replace')
+        raw_bytes = _cp1252_encode(clean_segment, 'replace')[0]
+        decoded = _big5_decode(raw_bytes, 'replace')[0]
         if _looks_like_valid_cjk(decoded):
             return decoded
     except (UnicodeEncodeError, UnicodeDecodeError):
@@ -211,6 +331,219 @@ def _try_decode_segment(segment):
 # DICOM PROCESSING FUNCTIONS (Dynamic pydicom import)
 # =============================================================================
 
+# SpecificCharacterSet (0008,0005)
+_CHARSET_TAG = 0x00080005
+
+# Transfer syntax whose stream is compressed, so element offsets are not
+# file offsets
+_DEFLATED_TS = '1.2.840.10008.1.2.1.99'
+
+# Retired group-length elements for the groups our target tags live in.
+# Resizing a value would invalidate them, so their presence forces a
+# full re-serialize.
+_GROUP_LENGTH_TAGS = [0x00080000, 0x00100000, 0x00180000]
+
+# Explicit short-form text VRs the splice path knows how to resize
+# (tag + VR + 2-byte length). Anything else, e.g. long-form UT with its
+# reserved bytes and 4-byte length, takes the full save.
+_SHORT_TEXT_VRS = ('PN', 'LO', 'SH', 'CS')
+
+# Explicit VRs using the long header form (2 reserved bytes + 4-byte
+# length); needed when walking element headers in the raw stream
+_LONG_FORM_VRS = (b'OB', b'OD', b'OF', b'OL', b'OV', b'OW',
+                  b'SQ', b'UC', b'UN', b'UR', b'UT')
+
+# (keyword, tag int) pairs for TARGET_TAGS, resolved on first use since
+# pydicom is an optional import
+_TARGET_TAG_INTS = None
+
+
+def _target_tag_ints():
+    """Resolve TARGET_TAGS keywords to DICOM tag integers once."""
+    global _TARGET_TAG_INTS
+    if _TARGET_TAG_INTS is None:
+        from pydicom.datadict import tag_for_keyword
+        _TARGET_TAG_INTS = [(name, tag_for_keyword(name)) for name in TARGET_TAGS]
+    return _TARGET_TAG_INTS
+
+
+def _find_charset_offset(path, implicit_vr, little_endian):
+    """
+    Locate SpecificCharacterSet by walking the element headers at the
+    front of the dataset in the raw stream.
+
+    Needed on pydicom 3.x, which converts the charset element during
+    parsing so its RawDataElement (and file offset) is never exposed.
+
+    Returns:
+        (length_field_offset, length_field_size, stored_length) or None
+        when the element cannot be located safely.
+    """
+    end = '<' if little_endian else '>'
+    try:
+        with open(path, 'rb') as f:
+            if f.read(132)[128:] != b'DICM':
+                return None
+
+            # File meta is always explicit VR little endian and starts
+            # with the (0002,0000) UL group length
+            header = f.read(12)
+            if (len(header) < 12 or header[:4] != b'\x02\x00\x00\x00'
+                    or header[4:6] != b'UL'):
+                return None
+            f.seek(struct.unpack('<I', header[8:12])[0], 1)
+
+            # Walk the dataset elements; (0008,0005) sits near the front
+            while True:
+                hdr = f.read(8)
+                if len(hdr) < 8:
+                    return None
+                group, elem = struct.unpack(end + 'HH', hdr[:4])
+                tag = (group << 16) | elem
+                if tag > _CHARSET_TAG:
+                    return None
+                if implicit_vr:
+                    len_size = 4
+                    length = struct.unpack(end + 'I', hdr[4:8])[0]
+                elif hdr[4:6] in _LONG_FORM_VRS:
+                    len_size = 4
+                    extra = f.read(4)
+                    if len(extra) < 4:
+                        return None
+                    length = struct.unpack(end + 'I', extra)[0]
+                else:
+                    len_size = 2
+                    length = struct.unpack(end + 'H', hdr[6:8])[0]
+                if length == 0xFFFFFFFF:
+                    return None
+                if tag == _CHARSET_TAG:
+                    return f.tell() - len_size, len_size, length
+                f.seek(length, 1)
+    except OSError:
+        return None
+
+
+def _splice_save(src, dest, ds, changes, charset_raw):
+    """
+    Write dest by splicing the fixed values into the original byte
+    stream instead of re-serializing the whole dataset.
+
+    The file is copied verbatim up to each changed element, the new
+    length field and UTF-8 value are emitted in its place, and the
+    untouched tail -- including multi-MB pixel data -- is streamed
+    through unchanged. This works regardless of whether the UTF-8
+    values are longer than the Big5 bytes they replace (an ideograph
+    grows from 2 to 3 bytes).
+
+    Returns:
+        bool: True if the file was written, False when splicing is not
+        possible and the caller must fall back to a full save.
+    """
+    if not changes:
+        return False
+
+    file_meta = getattr(ds, 'file_meta', None)
+    if file_meta is None or str(file_meta.get('TransferSyntaxUID', '')) == _DEFLATED_TS:
+        return False
+    if any(t in ds for t in _GROUP_LENGTH_TAGS):
+        return False
+
+    # Build (length_field_offset, replaced_size, new_bytes) records from
+    # the raw elements of the light read
+    records = []
+
+    def _add_record(len_offset, len_size, length, little_endian, new_value):
+        if len(new_value) % 2:
+            new_value += b' '  # text VRs pad to even length with space
+        if len(new_value) > (0xFFFF if len_size == 2 else 0xFFFFFFFE):
+            return False
+        fmt = ('<' if little_endian else '>') + ('I' if len_size == 4 else 'H')
+        records.append((len_offset, len_size + length,
+                        struct.pack(fmt, len(new_value)) + new_value))
+        return True
+
+    try:
+        implicit_vr = changes[0][2].is_implicit_VR
+        little_endian = changes[0][2].is_little_endian
+
+        for _tag_int, fixed_val, raw in changes:
+            offset = getattr(raw, 'value_tell', None)
+            length = getattr(raw, 'length', None)
+            if not offset or length is None or length == 0xFFFFFFFF:
+                return False
+            # The length field sits just before the value: 4 bytes for
+            # implicit VR, 2 for the explicit short text VRs. Long-form
+            # VRs (e.g. UT) lay their length out differently, so only
+            # splice the forms we know.
+            if raw.is_implicit_VR:
+                len_size = 4
+            elif str(getattr(raw, 'VR', None)) in _SHORT_TEXT_VRS:
+                len_size = 2
+            else:
+                return False
+            if not _add_record(offset - len_size, len_size, length,
+                               raw.is_little_endian, fixed_val.encode('utf-8')):
+                return False
+
+        # The charset element must be rewritten to UTF-8 as well, unless
+        # the file already declares it
+        if charset_raw is None:
+            return False
+        charset_value = charset_raw.value
+        if isinstance(charset_value, bytes):
+            declares_utf8 = b'ISO_IR 192' in charset_value
+        else:
+            # pydicom 3.x converts SpecificCharacterSet while parsing,
+            # so the value arrives as str (or a list of str)
+            declares_utf8 = 'ISO_IR 192' in str(charset_value)
+        if not declares_utf8:
+            if isinstance(charset_value, bytes):
+                # Raw element: offset and length come with it
+                offset = getattr(charset_raw, 'value_tell', None)
+                length = charset_raw.length
+                if not offset or length is None or length == 0xFFFFFFFF:
+                    return False
+                len_size = 4 if charset_raw.is_implicit_VR else 2
+                found = (offset - len_size, len_size, length)
+            else:
+                # Converted element: recover the offset from the stream
+                found = _find_charset_offset(src, implicit_vr, little_endian)
+                if found is None:
+                    return False
+            if not _add_record(found[0], found[1], found[2],
+                               little_endian, b'ISO_IR 192'):
+                return False
+    except Exception:
+        return False
+
+    records.sort()
+    prev_end = 0
+    for start, old_size, _new_bytes in records:
+        if start < prev_end:
+            return False
+        prev_end = start + old_size
+
+    tmp = dest + '.tmp'
+    try:
+        with open(src, 'rb') as fin, open(tmp, 'wb') as fout:
+            pos = 0
+            for start, old_size, new_bytes in records:
+                fin.seek(pos)
+                fout.write(fin.read(start - pos))
+                fout.write(new_bytes)
+                pos = start + old_size
+            fin.seek(pos)
+            shutil.copyfileobj(fin, fout)
+        os.replace(tmp, dest)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+    return True
+
+
 def process_dicom(file_path, output_path=None, dry_run=False, force_check=True):
     """
     Reads a DICOM file, checks for encoding errors, and saves it.
@@ -225,6 +558,17 @@ def process_dicom(file_path, output_path=None, dry_run=False, force_check=True):
     Returns:
         bool: True if file was modified/saved, False otherwise.
     """
+    # Magic-number probe: a DICOM Part-10 file has a 128-byte preamble
+    # followed by 'DICM'. Anything else is skipped for the cost of a
+    # 132-byte read instead of a full pydicom parse attempt.
+    try:
+        with open(file_path, 'rb') as f:
+            preamble = f.read(132)
+    except OSError:
+        return False
+    if len(preamble) < 132 or preamble[128:132] != b'DICM':
+        return False
+
     # Dynamic import of pydicom (only when needed)
     try:
         import pydicom
@@ -232,39 +576,64 @@ def process_dicom(file_path, output_path=None, dry_run=False, force_check=True):
         print("Error: pydicom is required for DICOM processing.")
         print("Install with: pip install pydicom")
         return False
-    
+
+    # When trusting the stored charset, read only SpecificCharacterSet
+    # first: files already marked UTF-8 are skipped without ever parsing
+    # the target tags. When force_check=True (default), we always
+    # examine the fields.
+    if not force_check:
+        try:
+            meta = pydicom.dcmread(
+                file_path,
+                specific_tags=["SpecificCharacterSet"],
+                stop_before_pixels=True,
+            )
+        except Exception:
+            return False
+        charset = getattr(meta, "SpecificCharacterSet", "")
+        if isinstance(charset, list):
+            charset = charset[0] if charset else ""
+        if "ISO_IR 192" in str(charset):
+            return False
+
+    # Light read: only the string tags we may fix, stopping before pixel
+    # data. This avoids pulling multi-MB PixelData just to inspect a
+    # handful of short values; the full dataset is re-read only if a
+    # save turns out to be necessary.
     try:
-        ds = pydicom.dcmread(file_path)
+        ds = pydicom.dcmread(
+            file_path,
+            specific_tags=(TARGET_TAGS + ["SpecificCharacterSet"]
+                           + _GROUP_LENGTH_TAGS),
+            stop_before_pixels=True,
+        )
     except Exception as e:
         # Not a valid DICOM or read error
         return False
 
-    # Get current charset
-    charset = getattr(ds, "SpecificCharacterSet", "")
-    if isinstance(charset, list):
-        charset = charset[0] if charset else ""
-    
-    # Skip only if NOT force_check AND already UTF-8
-    # When force_check=True (default), we always examine the fields
-    if not force_check and "ISO_IR 192" in str(charset):
-        return False
+    # Grab the raw charset element (with its file offset) before any
+    # access converts it; needed for the splice save path
+    charset_raw = ds.get_item(_CHARSET_TAG) if _CHARSET_TAG in ds else None
 
     updated = False
-    
-    # Check tags for mojibake
-    for tag in TARGET_TAGS:
-        if hasattr(ds, tag):
-            val = getattr(ds, tag)
+    changes = []
+
+    # Check tags for mojibake, indexing by precompiled tag int rather
+    # than repeating pydicom's keyword lookup per attribute access
+    for name, tag_int in _target_tag_ints():
+        if tag_int in ds:
+            # Raw element first: value access below converts it in place
+            raw_elem = ds.get_item(tag_int)
             # Convert PersonName objects to string for processing
-            val_str = str(val)
-            
+            val_str = str(ds[tag_int].value)
+
             fixed_val = fix_text_encoding(val_str)
-            
+
             if fixed_val:
                 if dry_run:
-                    print(f"  [Dry Run] {tag}: {val_str} -> {fixed_val}")
+                    print(f"  [Dry Run] {name}: {val_str} -> {fixed_val}")
                 else:
-                    setattr(ds, tag, fixed_val)
+                    changes.append((tag_int, fixed_val, raw_elem))
                 updated = True
 
     # Save logic
@@ -273,23 +642,57 @@ def process_dicom(file_path, output_path=None, dry_run=False, force_check=True):
             print(f"  [Dry Run] Would save to: {output_path or file_path}")
             return True
 
+        # Determine save location. Callers (scan_and_fix) have already
+        # created the destination directories, so no per-file makedirs.
+        dest = output_path if output_path else file_path
+
+        # Delta write: splice the changed values into the original byte
+        # stream, skipping the full re-serialize
+        if _splice_save(file_path, dest, ds, changes, charset_raw):
+            return True
+
+        # Fallback: re-read the full dataset and apply the fixes to it
+        ds = pydicom.dcmread(file_path)
+        for tag_int, fixed_val, _raw_elem in changes:
+            ds[tag_int].value = fixed_val
+
         # Ensure we set the charset so the new chars are read correctly
         ds.SpecificCharacterSet = 'ISO_IR 192'
 
-        # Determine save location
-        dest = output_path if output_path else file_path
-        
-        # Ensure dest dir exists
-        dest_dir = os.path.dirname(os.path.abspath(dest))
-        if dest_dir:
-            os.makedirs(dest_dir, exist_ok=True)
-        
         ds.save_as(dest)
         return True
 
     return False
 
 
+def _iter_files(root):
+    """
+    Yield os.DirEntry objects for every file under root, recursively.
+
+    Works directly on scandir entries so the cached stat/type info is
+    reused instead of being discarded the way os.walk does, and entry
+    paths come pre-joined.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _process_one(task):
+    """Picklable worker for the process pool: unpacks a task tuple."""
+    src_file, dest_file, dry_run, force_check = task
+    return process_dicom(src_file, dest_file, dry_run, force_check)
+
+
 def scan_and_fix(input_path, output_root=None, dry_run=False, force_check=True):
     """
     Main logic to handle file or directory recursion for DICOM files.
@@ -313,7 +716,12 @@ def scan_and_fix(input_path, output_root=None, dry_run=False, force_check=True):
                 dest = output_root
         else:
             dest = None  # In-place
-            
+
+        if dest and not dry_run:
+            dest_dir = os.path.dirname(os.path.abspath(dest))
+            if dest_dir:
+                os.makedirs(dest_dir, exist_ok=True)
+
         print(f"Processing file: {input_path}")
         modified = process_dicom(input_path, dest, dry_run, force_check)
         if modified:
@@ -324,28 +732,46 @@ def scan_and_fix(input_path, output_root=None, dry_run=False, force_check=True):
 
     # CASE 2: Directory
     if os.path.isdir(input_path):
-        count = 0
-        total = 0
         print(f"Scanning directory: {input_path}")
-        
-        for root, dirs, files in os.walk(input_path):
-            for name in files:
-                src_file = os.path.join(root, name)
-                total += 1
-                
-                # Determine destination
-                dest_file = None
-                if output_root:
-                    # Calculate relative path to maintain structure
-                    rel_path = os.path.relpath(src_file, input_path)
-                    dest_file = os.path.join(output_root, rel_path)
-
-                modified = process_dicom(src_file, dest_file, dry_run, force_check)
-                if modified:
-                    count += 1
-                    status = "Dry Run" if dry_run else "Fixed"
-                    print(f"[{status}] {name}")
-        
+
+        # Collect tasks first, then dispatch: each file is independent
+        # (dcmread + save), so the work parallelizes across cores.
+        tasks = []
+        for entry in _iter_files(input_path):
+            src_file = entry.path
+
+            # Determine destination
+            dest_file = None
+            if output_root:
+                # Calculate relative path to maintain structure
+                rel_path = os.path.relpath(src_file, input_path)
+                dest_file = os.path.join(output_root, rel_path)
+
+            tasks.append((src_file, dest_file, dry_run, force_check))
+
+        # Create destination directories up front: one makedirs per
+        # unique directory instead of one per file written
+        if output_root and not dry_run:
+            needed_dirs = {os.path.dirname(task[1]) for task in tasks if task[1]}
+            for d in needed_dirs:
+                if d:
+                    os.makedirs(d, exist_ok=True)
+
+        total = len(tasks)
+        if dry_run or total <= 1:
+            # Serial fallback keeps dry-run output readable
+            results = [_process_one(t) for t in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                results = list(ex.map(_process_one, tasks, chunksize=16))
+
+        count = 0
+        status = "Dry Run" if dry_run else "Fixed"
+        for task, modified in zip(tasks, results):
+            if modified:
+                count += 1
+                print(f"[{status}] {os.path.basename(task[0])}")
+
         print(f"\nOperation complete. Fixed: {count}/{total} files")
         return
 